@@ -1,8 +1,9 @@
 """Anonymization helpers for privacy-preserving cloud calls."""
 from __future__ import annotations
 
+from functools import lru_cache
 import re
-from typing import Dict, Tuple
+from typing import Dict, FrozenSet, Tuple
 
 ANONYMIZATION_MAP = {
     "Anthropic": "[COMPANY_A]",
@@ -12,22 +13,45 @@ ANONYMIZATION_MAP = {
     "Ollama": "[TOOL_B]",
 }
 
+# Longest terms first so overlapping entries prefer the most specific match.
+# Each term gets its own group; match.lastindex identifies the term even when
+# case-insensitive matching accepts text whose .lower() differs from the key.
+_TERMS = sorted(ANONYMIZATION_MAP.items(), key=lambda item: len(item[0]), reverse=True)
+_COMBINED = re.compile(
+    "|".join(f"({re.escape(original)})" for original, _placeholder in _TERMS),
+    re.IGNORECASE,
+)
+_GROUPS = {
+    index: (placeholder, original)
+    for index, (original, placeholder) in enumerate(_TERMS, start=1)
+}
+
 
 def anonymize(text: str) -> Tuple[str, Dict[str, str]]:
-    anonymized = text
+    # Reject with the same matcher used for replacement so the two cannot disagree.
+    if _COMBINED.search(text) is None:
+        return text, {}
+
     reverse_map: Dict[str, str] = {}
 
-    for original, placeholder in ANONYMIZATION_MAP.items():
-        pattern = re.compile(re.escape(original), re.IGNORECASE)
-        if pattern.search(anonymized):
-            anonymized = pattern.sub(placeholder, anonymized)
-            reverse_map[placeholder] = original
+    def _replace(match: re.Match[str]) -> str:
+        placeholder, original = _GROUPS[match.lastindex]
+        reverse_map[placeholder] = original
+        return placeholder
 
+    anonymized = _COMBINED.sub(_replace, text)
     return anonymized, reverse_map
 
 
+@lru_cache(maxsize=32)
+def _placeholder_pattern(placeholders: FrozenSet[str]) -> re.Pattern[str]:
+    return re.compile(
+        "|".join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True))
+    )
+
+
 def deanonymize(text: str, reverse_map: Dict[str, str]) -> str:
-    output = text
-    for placeholder, original in reverse_map.items():
-        output = output.replace(placeholder, original)
-    return output
+    if not reverse_map:
+        return text
+    pattern = _placeholder_pattern(frozenset(reverse_map))
+    return pattern.sub(lambda match: reverse_map[match.group(0)], text)
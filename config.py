@@ -1,6 +1,7 @@
 """Configuration and path management."""
 from __future__ import annotations
 
+from functools import lru_cache
 import os
 import platform
 from pathlib import Path
@@ -16,6 +17,7 @@ class Config:
     IS_LINUX = platform.system() == "Linux"
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_vault_path() -> Path:
         env_path = os.getenv("OBSIDIAN_VAULT_PATH")
         if env_path:
@@ -23,40 +25,52 @@ class Config:
         return Path.home() / "Documents" / "ObsidianVault"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def vault_path(cls) -> Path:
         return cls.get_vault_path()
 
     @classmethod
+    @lru_cache(maxsize=1)
     def audio_dir(cls) -> Path:
         return cls.vault_path() / "audio"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def processed_dir(cls) -> Path:
         return cls.audio_dir() / "processed"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def capture_file(cls) -> Path:
         return cls.vault_path() / "capture.md"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def logs_dir(cls) -> Path:
         return cls.vault_path() / "logs"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def raw_dir(cls) -> Path:
         return cls.vault_path() / "raw"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def sessions_dir(cls) -> Path:
         return cls.vault_path() / "sessions"
 
     @classmethod
+    @lru_cache(maxsize=1)
     def metrics_file(cls) -> Path:
         return cls.logs_dir() / "metrics.jsonl"
 
     # API keys / models
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
     WHISPER_MODEL = os.getenv("WHISPER_MODEL", "base")
+    WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "auto")
+    WHISPER_COMPUTE_TYPE = os.getenv("WHISPER_COMPUTE_TYPE", "auto")
+    WHISPER_BEAM_SIZE = int(os.getenv("WHISPER_BEAM_SIZE", "1"))
+    WHISPER_VAD_FILTER = os.getenv("WHISPER_VAD_FILTER", "true").lower() == "true"
     LOCAL_LLM_MODEL = os.getenv("LOCAL_LLM_MODEL", "meta-llama-3-8b-instruct")
     CLAUDE_MODEL = os.getenv("CLAUDE_MODEL", "claude-sonnet-4-5")
     LOCAL_LLM_API_BASE = os.getenv("LOCAL_LLM_API_BASE", "http://127.0.0.1:1234/v1")
@@ -65,6 +79,7 @@ class Config:
     LOCAL_LLM_READ_TIMEOUT_SEC = float(os.getenv("LOCAL_LLM_READ_TIMEOUT_SEC", "120"))
     LOCAL_LLM_RETRIES = int(os.getenv("LOCAL_LLM_RETRIES", "2"))
     LOCAL_LLM_RETRY_BACKOFF_SEC = float(os.getenv("LOCAL_LLM_RETRY_BACKOFF_SEC", "2"))
+    LOCAL_LLM_CHECK_TTL_SEC = float(os.getenv("LOCAL_LLM_CHECK_TTL_SEC", "60"))
 
     # Features
     USE_CLAUDE_FOR_COMPLEX = os.getenv("USE_CLAUDE_FOR_COMPLEX", "true").lower() == "true"
@@ -75,6 +90,9 @@ class Config:
     WATCH_SETTLE_SECONDS = float(os.getenv("WATCH_SETTLE_SECONDS", "2"))
     TRANSCRIPTION_PROGRESS_EVERY = int(os.getenv("TRANSCRIPTION_PROGRESS_EVERY", "10"))
 
+    # Manual batch runs (0 = half the CPU cores)
+    MANUAL_MAX_WORKERS = int(os.getenv("MANUAL_MAX_WORKERS", "0"))
+
     @classmethod
     def ensure_dirs(cls) -> None:
         cls.audio_dir().mkdir(parents=True, exist_ok=True)
@@ -1,28 +1,58 @@
 """LLM cleanup and task breakdown routing (Local OpenAI-compatible LLM + Claude)."""
 from __future__ import annotations
 
+import random
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import requests
-from anthropic import Anthropic
+from requests.adapters import HTTPAdapter
 
 from anonymization import anonymize, deanonymize
 from config import Config
 
+if TYPE_CHECKING:
+    import httpx
+    from anthropic import Anthropic
+
 
 class LLMProcessor:
     def __init__(self) -> None:
         self.anthropic_client: Optional[Anthropic] = None
+        self._http: Optional[httpx.Client] = None
         self._local_llm_checked = False
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Content-Type"] = "application/json"
+        if Config.LOCAL_LLM_API_KEY:
+            self._session.headers["Authorization"] = f"Bearer {Config.LOCAL_LLM_API_KEY}"
         if Config.ANTHROPIC_API_KEY:
-            self.anthropic_client = Anthropic(api_key=Config.ANTHROPIC_API_KEY)
+            import httpx
+            from anthropic import Anthropic
+
+            self._http = httpx.Client(
+                limits=httpx.Limits(max_keepalive_connections=4),
+                timeout=httpx.Timeout(120.0, connect=5.0),
+            )
+            self.anthropic_client = Anthropic(
+                api_key=Config.ANTHROPIC_API_KEY, http_client=self._http
+            )
 
     def _check_local_llm(self) -> None:
         if self._local_llm_checked:
             return
+        marker = Config.logs_dir() / ".local_llm_ok"
+        try:
+            if time.time() - marker.stat().st_mtime < Config.LOCAL_LLM_CHECK_TTL_SEC:
+                self._local_llm_checked = True
+                return
+        except OSError:
+            pass
+
         base = Config.LOCAL_LLM_API_BASE.rstrip("/")
-        response = requests.get(
+        response = self._session.get(
             f"{base}/models",
             timeout=(
                 Config.LOCAL_LLM_CONNECT_TIMEOUT_SEC,
@@ -30,6 +60,7 @@ class LLMProcessor:
             ),
         )
         response.raise_for_status()
+        marker.touch()
         self._local_llm_checked = True
 
     def _local_chat_completion(self, prompt: str, temperature: float, operation: str) -> str:
@@ -40,16 +71,8 @@ class LLMProcessor:
 
         for attempt in range(1, attempts + 1):
             try:
-                response = requests.post(
+                response = self._session.post(
                     f"{base}/chat/completions",
-                    headers={
-                        "Content-Type": "application/json",
-                        **(
-                            {"Authorization": f"Bearer {Config.LOCAL_LLM_API_KEY}"}
-                            if Config.LOCAL_LLM_API_KEY
-                            else {}
-                        ),
-                    },
                     json={
                         "model": Config.LOCAL_LLM_MODEL,
                         "temperature": temperature,
@@ -75,11 +98,14 @@ class LLMProcessor:
                 last_error = exc
                 if attempt >= attempts:
                     break
+                delay = random.uniform(
+                    0, min(60.0, Config.LOCAL_LLM_RETRY_BACKOFF_SEC * (2 ** (attempt - 1)))
+                )
                 print(
                     f"  Local LLM {operation} failed (attempt {attempt}/{attempts}). "
-                    f"Retrying in {Config.LOCAL_LLM_RETRY_BACKOFF_SEC:.1f}s..."
+                    f"Retrying in {delay:.1f}s..."
                 )
-                time.sleep(Config.LOCAL_LLM_RETRY_BACKOFF_SEC)
+                time.sleep(delay)
 
         raise RuntimeError(f"Local LLM {operation} failed after {attempts} attempts: {last_error}")
 
@@ -138,7 +164,7 @@ Tags allowed: #work #personal #research #quick #deep-work"""
         if Config.ANONYMIZE_FOR_CLAUDE:
             input_text, reverse_map = anonymize(clean_text)
 
-        message = self.anthropic_client.messages.create(
+        with self.anthropic_client.messages.stream(
             model=Config.CLAUDE_MODEL,
             max_tokens=2048,
             messages=[
@@ -156,14 +182,8 @@ Format:
 Include dependencies and execution order if relevant.""",
                 }
             ],
-        )
-
-        parts = []
-        for block in message.content:
-            text = getattr(block, "text", None)
-            if text:
-                parts.append(text)
-        result = "\n".join(parts).strip()
+        ) as stream:
+            result = "".join(stream.text_stream).strip()
 
         if reverse_map:
             result = deanonymize(result, reverse_map)
@@ -1,21 +1,54 @@
 """Manual processing trigger."""
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 from config import Config
 from process_audio import AudioProcessor
+from transcription import resolve_device
+
+_AUDIO_EXTENSIONS = frozenset(Config.WATCH_EXTENSIONS)
+
+_worker_processor: Optional[AudioProcessor] = None
+
+
+def _init_worker(cpu_threads: int) -> None:
+    # One processor per worker process, so each loads its Whisper model once.
+    global _worker_processor
+    _worker_processor = AudioProcessor(cpu_threads=cpu_threads)
+
+
+def _process_one(job: tuple[Path, bool, bool]) -> bool:
+    if _worker_processor is None:
+        raise RuntimeError("worker process was not initialized")
+    audio_path, raw_only, clean_only = job
+    return _worker_processor.process(audio_path, raw_only=raw_only, clean_only=clean_only)
+
+
+def _worker_count(file_count: int) -> int:
+    if Config.MANUAL_MAX_WORKERS > 0:
+        limit = Config.MANUAL_MAX_WORKERS
+    elif resolve_device()[0] == "cuda":
+        # Every worker would load its own model onto the same GPU.
+        limit = 1
+    else:
+        # CTranslate2 already runs several threads per model.
+        limit = (os.cpu_count() or 2) // 2
+    return max(1, min(limit, file_count))
 
 
 def _iter_audio_files() -> list[Path]:
-    return sorted(
-        [
-            f
-            for f in Config.audio_dir().iterdir()
-            if f.is_file() and f.suffix.lower() in Config.WATCH_EXTENSIONS
-        ]
-    )
+    with os.scandir(Config.audio_dir()) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if os.path.splitext(entry.name)[1].lower() in _AUDIO_EXTENSIONS
+            and entry.is_file()
+        )
 
 
 def _parse_args(argv: list[str]) -> tuple[str, bool, bool]:
@@ -36,7 +69,6 @@ def _parse_args(argv: list[str]) -> tuple[str, bool, bool]:
 
 def main() -> None:
     Config.validate()
-    processor = AudioProcessor()
     target, raw_only, clean_only = _parse_args(sys.argv)
 
     if target == "--all":
@@ -45,9 +77,22 @@ def main() -> None:
             print("No audio files found")
             return
 
+        workers = _worker_count(len(files))
         print(f"Found {len(files)} file(s)")
-        for item in files:
-            processor.process(item, raw_only=raw_only, clean_only=clean_only)
+        if workers == 1:
+            processor = AudioProcessor()
+            for item in files:
+                processor.process(item, raw_only=raw_only, clean_only=clean_only)
+            return
+
+        print(f"Processing with {workers} worker processes")
+        jobs = [(item, raw_only, clean_only) for item in files]
+        # Split the cores between workers so their CTranslate2 pools don't oversubscribe.
+        cpu_threads = max(1, (os.cpu_count() or 1) // workers)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(cpu_threads,)
+        ) as executor:
+            list(executor.map(_process_one, jobs))
         return
 
     audio_path = Path(target).expanduser()
@@ -55,7 +100,7 @@ def main() -> None:
         print(f"File not found: {audio_path}")
         sys.exit(1)
 
-    processor.process(audio_path, raw_only=raw_only, clean_only=clean_only)
+    AudioProcessor().process(audio_path, raw_only=raw_only, clean_only=clean_only)
 
 
 if __name__ == "__main__":
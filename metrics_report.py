@@ -1,61 +1,78 @@
 """Simple metrics summary for processing runs."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
+from typing import Iterator
 
 from config import Config
+from serialization import JSONDecodeError, loads
 
 
-def _load_rows(path: Path) -> list[dict]:
+def _iter_rows(path: Path) -> Iterator[dict]:
     if not path.exists():
-        return []
-    rows = []
-    with open(path, "r", encoding="utf-8") as handle:
+        return
+    with open(path, "rb") as handle:
         for line in handle:
             line = line.strip()
             if not line:
                 continue
             try:
-                rows.append(json.loads(line))
-            except json.JSONDecodeError:
+                yield loads(line)
+            except JSONDecodeError:
                 continue
-    return rows
 
 
-def _avg(values: list[float]) -> float:
-    return sum(values) / len(values) if values else 0.0
+def _avg(total: float, count: int) -> float:
+    return total / count if count else 0.0
 
 
 def main() -> None:
-    rows = _load_rows(Config.metrics_file())
-    if not rows:
-        print(f"No metrics found at {Config.metrics_file()}")
-        return
+    total = success = failed = raw_only = 0
+    totals_sum = 0.0
+    cleanup_sum = breakdown_sum = compression_sum = 0.0
+    cleanup_n = breakdown_n = compression_n = 0
 
-    total = len(rows)
-    success = [r for r in rows if r.get("status") == "success"]
-    failed = [r for r in rows if r.get("status") == "failed"]
-    raw_only = [r for r in rows if r.get("raw_only") is True and r.get("status") == "success"]
+    for row in _iter_rows(Config.metrics_file()):
+        total += 1
+        status = row.get("status")
+        if status == "failed":
+            failed += 1
+            continue
+        if status != "success":
+            continue
 
-    totals = [float(r.get("durations_sec", {}).get("total", 0.0)) for r in success]
-    cleanup = [float(r.get("durations_sec", {}).get("cleanup", 0.0)) for r in success if "cleanup" in r.get("durations_sec", {})]
-    breakdown = [float(r.get("durations_sec", {}).get("breakdown", 0.0)) for r in success if "breakdown" in r.get("durations_sec", {})]
-    compression = [float(r.get("compression_ratio", 0.0)) for r in success if "compression_ratio" in r]
+        success += 1
+        if row.get("raw_only") is True:
+            raw_only += 1
+        durations = row.get("durations_sec", {})
+        totals_sum += float(durations.get("total", 0.0))
+        if "cleanup" in durations:
+            cleanup_sum += float(durations["cleanup"])
+            cleanup_n += 1
+        if "breakdown" in durations:
+            breakdown_sum += float(durations["breakdown"])
+            breakdown_n += 1
+        if "compression_ratio" in row:
+            compression_sum += float(row["compression_ratio"])
+            compression_n += 1
+
+    if not total:
+        print(f"No metrics found at {Config.metrics_file()}")
+        return
 
     print("Metrics Summary")
     print(f"- metrics file: {Config.metrics_file()}")
     print(f"- total runs: {total}")
-    print(f"- successful runs: {len(success)}")
-    print(f"- failed runs: {len(failed)}")
-    print(f"- raw-only runs: {len(raw_only)}")
-    print(f"- avg total seconds (success): {_avg(totals):.2f}")
-    if cleanup:
-        print(f"- avg cleanup seconds: {_avg(cleanup):.2f}")
-    if breakdown:
-        print(f"- avg breakdown seconds: {_avg(breakdown):.2f}")
-    if compression:
-        print(f"- avg compression ratio (clean/raw chars): {_avg(compression):.3f}")
+    print(f"- successful runs: {success}")
+    print(f"- failed runs: {failed}")
+    print(f"- raw-only runs: {raw_only}")
+    print(f"- avg total seconds (success): {_avg(totals_sum, success):.2f}")
+    if cleanup_n:
+        print(f"- avg cleanup seconds: {_avg(cleanup_sum, cleanup_n):.2f}")
+    if breakdown_n:
+        print(f"- avg breakdown seconds: {_avg(breakdown_sum, breakdown_n):.2f}")
+    if compression_n:
+        print(f"- avg compression ratio (clean/raw chars): {_avg(compression_sum, compression_n):.3f}")
 
 
 if __name__ == "__main__":
@@ -1,23 +1,30 @@
 """Main audio processing pipeline for Obsidian capture with observability."""
 from __future__ import annotations
 
+import atexit
 from datetime import datetime
-import json
+import itertools
+import os
 from pathlib import Path
 import re
 import shutil
 import time
-from typing import Any
+from typing import Any, BinaryIO
 
 from config import Config
 from llm import LLMProcessor
+from serialization import dumps
 from transcription import Transcriber
 
+_SESSION_ID_RE = re.compile(r"[^a-zA-Z0-9._-]+")
+
 
 class AudioProcessor:
-    def __init__(self) -> None:
-        self.transcriber = Transcriber()
+    def __init__(self, cpu_threads: int = 0) -> None:
+        self.transcriber = Transcriber(cpu_threads=cpu_threads)
         self.llm = LLMProcessor()
+        self._append_handles: dict[Path, BinaryIO] = {}
+        atexit.register(self.close)
 
     def process(
         self, audio_path: Path, raw_only: bool = False, clean_only: bool = False
@@ -26,9 +33,8 @@ class AudioProcessor:
             raise ValueError("raw_only and clean_only cannot both be true")
 
         started_at = datetime.now()
-        session_id = self._make_session_id(audio_path, started_at)
-        session_dir = Config.sessions_dir() / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+        session_dir = self._create_session_dir(audio_path, started_at)
+        session_id = session_dir.name
 
         metrics: dict[str, Any] = {
             "session_id": session_id,
@@ -59,7 +65,7 @@ class AudioProcessor:
             metrics["transcription_method"] = transcription_method
             print(f"  OK ({transcription_method})")
 
-            raw_path = self._save_raw_transcript(audio_path, raw_text, session_dir)
+            raw_path = self._save_raw_transcript(audio_path, raw_text, session_dir, started_at)
             metrics["raw_transcript_path"] = str(raw_path)
             metrics["raw_chars"] = len(raw_text)
             metrics["raw_words"] = len(raw_text.split())
@@ -67,14 +73,14 @@ class AudioProcessor:
 
             if raw_only:
                 print("Step 2/2: Raw-only mode, skipping cleanup and task breakdown...")
-                archived_path = self._archive_audio(audio_path)
+                archived_path = self._archive_audio(audio_path, started_at)
                 metrics["archived_audio_path"] = str(archived_path)
                 metrics["breakdown_model"] = "raw_only"
                 metrics["status"] = "success"
                 metrics["durations_sec"]["total"] = round(time.perf_counter() - t0, 3)
                 self._write_session_metadata(session_dir, metrics)
                 self._append_metrics(metrics)
-                self._log_event(audio_path, transcription_method, "raw_only")
+                self._log_event(audio_path, transcription_method, "raw_only", started_at)
                 print("Complete (raw-only)")
                 return True
 
@@ -120,19 +126,20 @@ class AudioProcessor:
                 breakdown=breakdown,
                 transcription_method=transcription_method,
                 breakdown_model=model_used,
+                now=started_at,
             )
             metrics["durations_sec"]["capture_write"] = round(
                 time.perf_counter() - t_capture, 3
             )
 
-            archived_path = self._archive_audio(audio_path)
+            archived_path = self._archive_audio(audio_path, started_at)
             metrics["archived_audio_path"] = str(archived_path)
             metrics["status"] = "success"
             metrics["durations_sec"]["total"] = round(time.perf_counter() - t0, 3)
 
             self._write_session_metadata(session_dir, metrics)
             self._append_metrics(metrics)
-            self._log_event(audio_path, transcription_method, model_used)
+            self._log_event(audio_path, transcription_method, model_used, started_at)
 
             print("Complete")
             return True
@@ -153,8 +160,9 @@ class AudioProcessor:
         breakdown: str,
         transcription_method: str,
         breakdown_model: str,
+        now: datetime,
     ) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        timestamp = now.strftime("%Y-%m-%d %H:%M")
 
         entry = f"""
 ## {timestamp}
@@ -173,51 +181,113 @@ class AudioProcessor:
 ---
 """
 
+        # capture.md is a vault note that editors and sync tools may replace or
+        # rename, so it is reopened per entry rather than held open.
         with open(Config.capture_file(), "a", encoding="utf-8") as handle:
             handle.write(entry)
 
-    def _save_raw_transcript(self, audio_path: Path, raw_text: str, session_dir: Path) -> Path:
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-        raw_output = Config.raw_dir() / f"{timestamp}-{audio_path.stem}.txt"
+    def _save_raw_transcript(
+        self, audio_path: Path, raw_text: str, session_dir: Path, now: datetime
+    ) -> Path:
+        timestamp = now.strftime("%Y%m%d-%H%M%S")
+        Config.raw_dir().mkdir(parents=True, exist_ok=True)
+        for attempt in itertools.count():
+            suffix = f"-{attempt}" if attempt else ""
+            raw_output = Config.raw_dir() / f"{timestamp}-{audio_path.stem}{suffix}.txt"
+            try:
+                # Exclusive create reserves the name across parallel workers.
+                raw_output.touch(exist_ok=False)
+                break
+            except FileExistsError:
+                continue
         self._write_text(raw_output, raw_text)
 
         session_output = session_dir / "raw_transcript.txt"
         self._write_text(session_output, raw_text)
         return session_output
 
-    def _archive_audio(self, audio_path: Path) -> Path:
+    def _archive_audio(self, audio_path: Path, now: datetime) -> Path:
         destination = Config.processed_dir() / audio_path.name
         if destination.exists():
-            suffix = datetime.now().strftime("%Y%m%d-%H%M%S")
+            suffix = now.strftime("%Y%m%d-%H%M%S")
             destination = Config.processed_dir() / f"{audio_path.stem}-{suffix}{audio_path.suffix}"
         shutil.move(str(audio_path), str(destination))
         return destination
 
-    def _log_event(self, audio_path: Path, transcription_method: str, model_used: str) -> None:
-        log_file = Config.logs_dir() / f"{datetime.now().strftime('%Y-%m')}-processing.jsonl"
+    def _log_event(
+        self, audio_path: Path, transcription_method: str, model_used: str, now: datetime
+    ) -> None:
+        log_file = Config.logs_dir() / f"{now.strftime('%Y-%m')}-processing.jsonl"
         payload = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "audio_file": audio_path.name,
             "transcription_method": transcription_method,
             "breakdown_model": model_used,
         }
-        with open(log_file, "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload) + "\n")
+        self._close_append_handles(keep={log_file, Config.metrics_file()})
+        self._append(log_file, dumps(payload) + b"\n")
 
     def _append_metrics(self, metrics: dict[str, Any]) -> None:
-        with open(Config.metrics_file(), "a", encoding="utf-8") as handle:
-            handle.write(json.dumps(metrics) + "\n")
+        self._append(Config.metrics_file(), dumps(metrics) + b"\n")
+
+    def _append(self, path: Path, data: bytes) -> None:
+        handle = self._get_append_handle(path)
+        handle.write(data)
+        handle.flush()
+
+    def _get_append_handle(self, path: Path) -> BinaryIO:
+        handle = self._append_handles.get(path)
+        if handle is not None and not handle.closed:
+            try:
+                if os.stat(path).st_ino == os.fstat(handle.fileno()).st_ino:
+                    return handle
+            except OSError:
+                pass
+            # The file was replaced, moved or deleted since it was opened.
+            handle.close()
+        handle = open(path, "ab")
+        self._append_handles[path] = handle
+        return handle
+
+    def _close_append_handles(self, keep: set[Path] | None = None) -> None:
+        for path in list(self._append_handles):
+            if keep is None or path not in keep:
+                self._append_handles.pop(path).close()
+
+    def close(self) -> None:
+        self._close_append_handles()
 
     def _write_session_metadata(self, session_dir: Path, metrics: dict[str, Any]) -> None:
         metadata = session_dir / "session_meta.json"
-        self._write_text(metadata, json.dumps(metrics, indent=2))
+        self._write_bytes(metadata, dumps(metrics, indent=True) + b"\n")
 
     def _write_text(self, path: Path, content: str) -> Path:
+        # Match text-mode newline translation for the human-facing transcripts.
+        text = content.strip() + "\n"
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        return self._write_bytes(path, text.encode("utf-8"))
+
+    def _write_bytes(self, path: Path, data: bytes) -> Path:
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as handle:
-            handle.write(content.strip() + "\n")
+        with open(path, "wb") as handle:
+            handle.write(data)
         return path
 
     def _make_session_id(self, audio_path: Path, now: datetime) -> str:
-        base = re.sub(r"[^a-zA-Z0-9._-]+", "-", audio_path.stem).strip("-").lower() or "audio"
+        base = _SESSION_ID_RE.sub("-", audio_path.stem).strip("-").lower() or "audio"
         return f"{now.strftime('%Y%m%d-%H%M%S')}-{base}"
+
+    def _create_session_dir(self, audio_path: Path, now: datetime) -> Path:
+        # Files sharing a sanitized stem (e.g. "Note 1.m4a", "note-1.mp3") can start
+        # in the same second, so a numeric suffix keeps their sessions apart.
+        session_id = self._make_session_id(audio_path, now)
+        Config.sessions_dir().mkdir(parents=True, exist_ok=True)
+        for attempt in itertools.count():
+            suffix = f"-{attempt}" if attempt else ""
+            session_dir = Config.sessions_dir() / f"{session_id}{suffix}"
+            try:
+                session_dir.mkdir(exist_ok=False)
+                return session_dir
+            except FileExistsError:
+                continue
@@ -2,38 +2,101 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
-
-from faster_whisper import WhisperModel
+from typing import TYPE_CHECKING, Optional
 
 from config import Config
 
+if TYPE_CHECKING:
+    from faster_whisper import WhisperModel
+
+
+_CPU_FALLBACK = ("cpu", "int8")
+
+
+def resolve_device() -> tuple[str, str]:
+    device = Config.WHISPER_DEVICE.lower()
+    if device == "auto":
+        import ctranslate2
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+    compute_type = Config.WHISPER_COMPUTE_TYPE.lower()
+    if compute_type == "auto":
+        compute_type = "float16" if device == "cuda" else "int8"
+    return device, compute_type
+
 
 class Transcriber:
-    def __init__(self) -> None:
+    def __init__(self, cpu_threads: int = 0) -> None:
+        # 0 keeps faster-whisper's default thread count.
+        self.cpu_threads = cpu_threads
         self._model: Optional[WhisperModel] = None
+        self._device: Optional[str] = None
+        self._force_cpu = False
+
+    def _can_fall_back(self) -> bool:
+        # Only auto-selected GPUs fall back; an explicit WHISPER_DEVICE is honored.
+        return Config.WHISPER_DEVICE.lower() == "auto" and self._device != "cpu"
 
     def _load_model(self) -> WhisperModel:
         if self._model is None:
-            print(f"Loading Whisper model: {Config.WHISPER_MODEL}")
-            self._model = WhisperModel(Config.WHISPER_MODEL, device="cpu", compute_type="int8")
+            from faster_whisper import WhisperModel
+
+            device, compute_type = _CPU_FALLBACK if self._force_cpu else resolve_device()
+            self._device = device
+            print(f"Loading Whisper model: {Config.WHISPER_MODEL} ({device}, {compute_type})")
+            try:
+                self._model = WhisperModel(
+                    Config.WHISPER_MODEL,
+                    device=device,
+                    compute_type=compute_type,
+                    cpu_threads=self.cpu_threads,
+                )
+            except Exception as exc:
+                if not self._can_fall_back():
+                    raise
+                self._use_cpu_fallback(exc)
+                return self._load_model()
         return self._model
 
+    def _use_cpu_fallback(self, exc: Exception) -> None:
+        print(f"  Whisper failed on {self._device} ({exc}); falling back to cpu/int8")
+        self._model = None
+        self._force_cpu = True
+
     def transcribe(self, audio_path: Path) -> tuple[str, str]:
         model = self._load_model()
-        segments, _info = model.transcribe(str(audio_path))
+        try:
+            return self._transcribe(model, audio_path)
+        except RuntimeError as exc:
+            # Missing CUDA libraries (cuBLAS/cuDNN) often surface on first encode.
+            if not self._can_fall_back():
+                raise
+            self._use_cpu_fallback(exc)
+            return self._transcribe(self._load_model(), audio_path)
+
+    def _transcribe(self, model: WhisperModel, audio_path: Path) -> tuple[str, str]:
+        segments, _info = model.transcribe(
+            str(audio_path),
+            beam_size=max(1, Config.WHISPER_BEAM_SIZE),
+            vad_filter=Config.WHISPER_VAD_FILTER,
+            vad_parameters={"min_silence_duration_ms": 500},
+            condition_on_previous_text=False,
+        )
         pieces: list[str] = []
         count = 0
         for segment in segments:
             count += 1
-            pieces.append(segment.text.strip())
+            text = segment.text.strip()
+            if text:
+                pieces.append(text)
             if count % max(1, Config.TRANSCRIPTION_PROGRESS_EVERY) == 0:
                 print(
                     f"  ...transcribed {count} segments "
                     f"(up to ~{segment.end:.1f}s)"
                 )
 
-        text = " ".join(pieces).strip()
+        text = " ".join(pieces)
         if not text:
             raise ValueError("Transcription returned empty text")
         return text, "whisper_local"
@@ -1,6 +1,8 @@
 """Watch Obsidian audio folder and auto-process new files."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import time
 from pathlib import Path
 
@@ -15,6 +17,10 @@ class AudioFileHandler(FileSystemEventHandler):
     def __init__(self) -> None:
         self.processor = AudioProcessor()
         self.processing: set[Path] = set()
+        self._pending: dict[Path, threading.Timer] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=1)
 
     def on_created(self, event: FileSystemEvent) -> None:
         if event.is_directory:
@@ -24,16 +30,76 @@ class AudioFileHandler(FileSystemEventHandler):
         if path.suffix.lower() not in Config.WATCH_EXTENSIONS:
             return
 
-        if path in self.processing:
-            return
-
-        self.processing.add(path)
-        print(f"\nNew audio detected: {path.name}")
+        with self._lock:
+            if path in self.processing:
+                return
+            if path not in self._pending:
+                print(f"\nNew audio detected: {path.name}")
+            self._schedule(path)
 
-        time.sleep(Config.WATCH_SETTLE_SECONDS)
-        self.processor.process(path)
+    def on_modified(self, event: FileSystemEvent) -> None:
+        if event.is_directory:
+            return
 
-        self.processing.discard(path)
+        # Writes to a file that is still settling restart its debounce timer.
+        path = Path(event.src_path)
+        with self._lock:
+            if path in self._pending:
+                self._schedule(path)
+
+    def warm_up(self) -> None:
+        # Runs on the worker so it is ordered before any queued file.
+        self._executor.submit(self._warm_up)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            for timer in self._pending.values():
+                timer.cancel()
+            self._pending.clear()
+        # Only the file already being processed finishes; queued ones are dropped.
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        with self._lock:
+            for path in sorted(self.processing):
+                print(f"Skipped (not processed): {path.name}")
+            self.processing.clear()
+
+    def _schedule(self, path: Path) -> None:
+        timer = self._pending.pop(path, None)
+        if timer is not None:
+            timer.cancel()
+        timer = threading.Timer(Config.WATCH_SETTLE_SECONDS, self._enqueue, args=(path,))
+        timer.daemon = True
+        self._pending[path] = timer
+        timer.start()
+
+    def _enqueue(self, path: Path) -> None:
+        with self._lock:
+            # A timer that was restarted while waiting on the lock is stale.
+            if self._closed or self._pending.get(path) is not threading.current_thread():
+                return
+            del self._pending[path]
+            self.processing.add(path)
+            self._executor.submit(self._process_safe, path)
+
+    def _warm_up(self) -> None:
+        try:
+            self.processor.transcriber._load_model()
+        except Exception as exc:
+            print(f"Warning: could not preload Whisper model: {exc}")
+        try:
+            self.processor.llm._check_local_llm()
+        except Exception as exc:
+            print(f"Warning: local LLM is not reachable yet: {exc}")
+
+    def _process_safe(self, path: Path) -> None:
+        try:
+            self.processor.process(path)
+        except Exception as exc:
+            print(f"Error processing {path.name}: {exc}")
+        finally:
+            with self._lock:
+                self.processing.discard(path)
 
 
 def watch() -> None:
@@ -42,9 +108,11 @@ def watch() -> None:
     print(f"Capture output: {Config.capture_file()}")
     print("Press Ctrl+C to stop\n")
 
+    handler = AudioFileHandler()
     observer = Observer()
-    observer.schedule(AudioFileHandler(), str(Config.audio_dir()), recursive=False)
+    observer.schedule(handler, str(Config.audio_dir()), recursive=False)
     observer.start()
+    handler.warm_up()
 
     try:
         while True:
@@ -53,6 +121,7 @@ def watch() -> None:
         observer.stop()
 
     observer.join()
+    handler.shutdown()
 
 
 if __name__ == "__main__":